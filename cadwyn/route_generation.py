@@ -1,7 +1,7 @@
 import re
 from collections import defaultdict
 from collections.abc import Callable, Sequence
-from copy import copy, deepcopy
+from copy import copy
 from dataclasses import dataclass
 from typing import (
     TYPE_CHECKING,
@@ -52,6 +52,8 @@ _WR = TypeVar("_WR", bound=APIRouter, default=APIRouter)
 _RouteT = TypeVar("_RouteT", bound=BaseRoute)
 # This is a hack we do because we can't guarantee how the user will use the router.
 _DELETED_ROUTE_TAG = "_CADWYN_DELETED_ROUTE"
+_NO_METHODS: frozenset[str] = frozenset()
+_PATH_PARAM_PATTERN = re.compile(r"{([^}]*)}")
 
 
 @dataclass(slots=True, frozen=True, eq=True)
@@ -101,12 +103,16 @@ def copy_route(route: _RouteT) -> _RouteT:
     if not isinstance(route, APIRoute):
         return copy(route)
 
-    # This is slightly wasteful in terms of resources but it makes it easy for us
-    # to make sure that new versions of FastAPI are going to be supported even if
-    # APIRoute gets new attributes.
-    new_route = deepcopy(route)
+    # A shallow copy still picks up any new attributes that FastAPI might add to APIRoute
+    # but it is much cheaper than a deepcopy of the whole route graph. We only need to
+    # duplicate the attributes that Cadwyn mutates in place between versions. Everything
+    # else is either immutable or gets reassigned as a whole during generation.
+    new_route = copy(route)
+    new_route.tags = copy(route.tags)
     new_route.dependant = copy(route.dependant)
     new_route.dependencies = copy(route.dependencies)
+    if route.callbacks:
+        new_route.callbacks = [copy_route(callback) for callback in route.callbacks]
     return new_route
 
 
@@ -118,9 +124,11 @@ class _EndpointTransformer(Generic[_R, _WR]):
         self.parent_webhooks_router = webhooks
         self.schema_generators = generate_versioned_models(versions)
 
-        self.routes_that_never_existed = [
-            route for route in parent_router.routes if isinstance(route, APIRoute) and _DELETED_ROUTE_TAG in route.tags
-        ]
+        # Grouped by (path, function name) because that's how we look them up when a deleted route gets restored
+        self.routes_that_never_existed: defaultdict[tuple[str, str], list[APIRoute]] = defaultdict(list)
+        for route in parent_router.routes:
+            if isinstance(route, APIRoute) and _DELETED_ROUTE_TAG in route.tags:
+                self.routes_that_never_existed[(route.path.rstrip("/"), route.endpoint.__name__)].append(route)
 
     def transform(self) -> GeneratedRouters[_R, _WR]:
         router = copy_router(self.parent_router)
@@ -147,27 +155,28 @@ class _EndpointTransformer(Generic[_R, _WR]):
                 f"@VersionedAPIRouter.{VersionedAPIRouter.only_exists_in_older_versions.__name__} "
                 "must be restored in one of the older versions. Otherwise you just need to delete it altogether. "
                 "The following routes have been marked with that decorator but were never restored: "
-                f"{self.routes_that_never_existed}",
+                f"{[route for routes in self.routes_that_never_existed.values() for route in routes]}",
             )
 
+        older_routers = list(routers.values())
         for route_index, head_route in enumerate(self.parent_router.routes):
             if not isinstance(head_route, APIRoute):
                 continue
             _add_request_and_response_params(head_route)
+            # A single shallow copy is shared by all older routes because request migrations only ever read it
             copy_of_dependant = copy(head_route.dependant)
 
-            for older_router in list(routers.values()):
+            for older_router in older_routers:
                 older_route = older_router.routes[route_index]
 
                 # We know they are APIRoutes because of the check at the very beginning of the top loop.
                 # I.e. Because head_route is an APIRoute, both routes are  APIRoutes too
                 older_route = cast(APIRoute, older_route)
                 # Wait.. Why do we need this code again?
-                if older_route.body_field is not None and _route_has_a_simple_body_schema(older_route):
-                    if hasattr(older_route.body_field.type_, "__cadwyn_original_model__"):
-                        template_older_body_model = older_route.body_field.type_.__cadwyn_original_model__
-                    else:
-                        template_older_body_model = older_route.body_field.type_
+                older_body_field = older_route.body_field
+                if older_body_field is not None and _route_has_a_simple_body_schema(older_route):
+                    older_body_type = older_body_field.type_
+                    template_older_body_model = getattr(older_body_type, "__cadwyn_original_model__", older_body_type)
                 else:
                     template_older_body_model = None
                 _add_data_migrations_to_route(
@@ -175,7 +184,7 @@ class _EndpointTransformer(Generic[_R, _WR]):
                     # NOTE: The fact that we use latest here assumes that the route can never change its response schema
                     head_route,
                     template_older_body_model,
-                    older_route.body_field.alias if older_route.body_field is not None else None,
+                    older_body_field.alias if older_body_field is not None else None,
                     copy_of_dependant,
                     self.versions,
                 )
@@ -198,77 +207,71 @@ class _EndpointTransformer(Generic[_R, _WR]):
             router
         )
 
-        for version_change in version.changes:
-            for by_path_converters in [
-                *version_change.alter_response_by_path_instructions.values(),
-                *version_change.alter_request_by_path_instructions.values(),
-            ]:
-                for by_path_converter in by_path_converters:
-                    missing_methods = by_path_converter.methods.difference(
-                        path_to_route_methods_mapping[by_path_converter.path]
-                    )
-
-                    if missing_methods:
-                        raise RouteByPathConverterDoesNotApplyToAnythingError(
-                            f"{by_path_converter.repr_name} "
-                            f'"{version_change.__name__}.{by_path_converter.transformer.__name__}" '
-                            f"failed to find routes with the following methods: {list(missing_methods)}. "
-                            f"This means that you are trying to apply this converter to non-existing endpoint(s). "
-                            "Please, check whether the path and methods are correct. (hint: path must include "
-                            "all path variables and have a name that was used in the version that this "
-                            "VersionChange resides in)"
-                        )
+        converters = self.versions._data_converters_per_version[version.value]
+        get_route_methods = path_to_route_methods_mapping.get
+
+        for version_change, by_path_converter in converters.by_path:
+            missing_methods = by_path_converter.methods - get_route_methods(by_path_converter.path, _NO_METHODS)
+
+            if missing_methods:
+                raise RouteByPathConverterDoesNotApplyToAnythingError(
+                    f"{by_path_converter.repr_name} "
+                    f'"{version_change.__name__}.{by_path_converter.transformer.__name__}" '
+                    f"failed to find routes with the following methods: {list(missing_methods)}. "
+                    f"This means that you are trying to apply this converter to non-existing endpoint(s). "
+                    "Please, check whether the path and methods are correct. (hint: path must include "
+                    "all path variables and have a name that was used in the version that this "
+                    "VersionChange resides in)"
+                )
 
-            for by_schema_converters in version_change.alter_request_by_schema_instructions.values():
-                for by_schema_converter in by_schema_converters:
-                    if not by_schema_converter.check_usage:  # pragma: no cover
-                        continue
-                    missing_models = set(by_schema_converter.schemas) - head_request_bodies
-                    if missing_models:
-                        raise RouteRequestBySchemaConverterDoesNotApplyToAnythingError(
-                            f"Request by body schema converter "
-                            f'"{version_change.__name__}.{by_schema_converter.transformer.__name__}" '
-                            f"failed to find routes with the following body schemas: "
-                            f"{[m.__name__ for m in missing_models]}. "
-                            f"This means that you are trying to apply this converter to non-existing endpoint(s). "
-                        )
-            for by_schema_converters in version_change.alter_response_by_schema_instructions.values():
-                for by_schema_converter in by_schema_converters:
-                    if not by_schema_converter.check_usage:  # pragma: no cover
-                        continue
-                    missing_models = set(by_schema_converter.schemas) - head_response_models
-                    if missing_models:
-                        raise RouteResponseBySchemaConverterDoesNotApplyToAnythingError(
-                            f"Response by response model converter "
-                            f'"{version_change.__name__}.{by_schema_converter.transformer.__name__}" '
-                            f"failed to find routes with the following response models: "
-                            f"{[m.__name__ for m in missing_models]}. "
-                            f"This means that you are trying to apply this converter to non-existing endpoint(s). "
-                            "If this is intentional and this converter really does not apply to any endpoints, then "
-                            "pass check_usage=False argument to "
-                            f"{version_change.__name__}.{by_schema_converter.transformer.__name__}"
-                        )
+        for version_change, by_schema_converter, schemas in converters.request_by_schema:
+            if not by_schema_converter.check_usage:  # pragma: no cover
+                continue
+            missing_models = schemas - head_request_bodies
+            if missing_models:
+                raise RouteRequestBySchemaConverterDoesNotApplyToAnythingError(
+                    f"Request by body schema converter "
+                    f'"{version_change.__name__}.{by_schema_converter.transformer.__name__}" '
+                    f"failed to find routes with the following body schemas: "
+                    f"{[m.__name__ for m in missing_models]}. "
+                    f"This means that you are trying to apply this converter to non-existing endpoint(s). "
+                )
+        for version_change, by_schema_converter, schemas in converters.response_by_schema:
+            if not by_schema_converter.check_usage:  # pragma: no cover
+                continue
+            missing_models = schemas - head_response_models
+            if missing_models:
+                raise RouteResponseBySchemaConverterDoesNotApplyToAnythingError(
+                    f"Response by response model converter "
+                    f'"{version_change.__name__}.{by_schema_converter.transformer.__name__}" '
+                    f"failed to find routes with the following response models: "
+                    f"{[m.__name__ for m in missing_models]}. "
+                    f"This means that you are trying to apply this converter to non-existing endpoint(s). "
+                    "If this is intentional and this converter really does not apply to any endpoints, then "
+                    "pass check_usage=False argument to "
+                    f"{version_change.__name__}.{by_schema_converter.transformer.__name__}"
+                )
 
     def _extract_all_routes_identifiers(
         self, router: APIRouter
     ) -> tuple[defaultdict[str, set[str]], set[Any], set[Any]]:
-        response_models: set[Any] = set()
-        request_bodies: set[Any] = set()
-        path_to_route_methods_mapping: dict[str, set[str]] = defaultdict(set)
+        head_response_models: set[Any] = set()
+        head_request_bodies: set[Any] = set()
+        path_to_route_methods_mapping: defaultdict[str, set[str]] = defaultdict(set)
 
         for route in router.routes:
-            if isinstance(route, APIRoute):
-                if route.response_model is not None and lenient_issubclass(route.response_model, BaseModel):
-                    response_models.add(route.response_model)
-                    # Not sure if it can ever be None when it's a simple schema. Eh, I would rather be safe than sorry
-                if _route_has_a_simple_body_schema(route) and route.body_field is not None:
-                    annotation = route.body_field.field_info.annotation
-                    if annotation is not None and lenient_issubclass(annotation, BaseModel):
-                        request_bodies.add(annotation)
-                path_to_route_methods_mapping[route.path] |= route.methods
-
-        head_response_models = {model.__cadwyn_original_model__ for model in response_models}
-        head_request_bodies = {getattr(body, "__cadwyn_original_model__", body) for body in request_bodies}
+            if not isinstance(route, APIRoute):
+                continue
+            response_model = route.response_model
+            if response_model is not None and lenient_issubclass(response_model, BaseModel):
+                head_response_models.add(getattr(response_model, "__cadwyn_original_model__", response_model))
+            # Not sure if it can ever be None when it's a simple schema. Eh, I would rather be safe than sorry
+            body_field = route.body_field
+            if body_field is not None and _route_has_a_simple_body_schema(route):
+                annotation = body_field.field_info.annotation
+                if annotation is not None and lenient_issubclass(annotation, BaseModel):
+                    head_request_bodies.add(getattr(annotation, "__cadwyn_original_model__", annotation))
+            path_to_route_methods_mapping[route.path].update(route.methods)
 
         return path_to_route_methods_mapping, head_response_models, head_request_bodies
 
@@ -278,10 +281,10 @@ class _EndpointTransformer(Generic[_R, _WR]):
         routes: list[BaseRoute] | list[APIRoute],
         version: Version,
     ):
+        route_index = _RouteIndex(routes)
         for version_change in version.changes:
             for instruction in version_change.alter_endpoint_instructions:
-                original_routes = _get_routes(
-                    routes,
+                original_routes = route_index.get_routes(
                     instruction.endpoint_path,
                     instruction.endpoint_methods,
                     instruction.endpoint_func_name,
@@ -291,8 +294,7 @@ class _EndpointTransformer(Generic[_R, _WR]):
                 methods_we_should_have_applied_changes_to = instruction.endpoint_methods.copy()
 
                 if isinstance(instruction, EndpointDidntExistInstruction):
-                    deleted_routes = _get_routes(
-                        routes,
+                    deleted_routes = route_index.get_routes(
                         instruction.endpoint_path,
                         instruction.endpoint_methods,
                         instruction.endpoint_func_name,
@@ -328,8 +330,7 @@ class _EndpointTransformer(Generic[_R, _WR]):
                             f"distinguish between them. Function names of endpoints that already existed: "
                             f"{[r.endpoint.__name__ for r in original_routes]}",
                         )
-                    deleted_routes = _get_routes(
-                        routes,
+                    deleted_routes = route_index.get_routes(
                         instruction.endpoint_path,
                         instruction.endpoint_methods,
                         instruction.endpoint_func_name,
@@ -349,15 +350,18 @@ class _EndpointTransformer(Generic[_R, _WR]):
                         methods_to_which_we_applied_changes |= deleted_route.methods
                         deleted_route.tags.remove(_DELETED_ROUTE_TAG)
 
+                        never_existed_key = (deleted_route.path.rstrip("/"), deleted_route.endpoint.__name__)
                         routes_that_never_existed = _get_routes(
-                            self.routes_that_never_existed,
+                            self.routes_that_never_existed.get(never_existed_key, ()),
                             deleted_route.path,
                             deleted_route.methods,
                             deleted_route.endpoint.__name__,
                             is_deleted=True,
                         )
                         if len(routes_that_never_existed) == 1:
-                            self.routes_that_never_existed.remove(routes_that_never_existed[0])
+                            self.routes_that_never_existed[never_existed_key].remove(routes_that_never_existed[0])
+                            if not self.routes_that_never_existed[never_existed_key]:
+                                del self.routes_that_never_existed[never_existed_key]
                         elif len(routes_that_never_existed) > 1:  # pragma: no cover
                             # I am not sure if it's possible to get to this error but I also don't want
                             # to remove it because I like its clarity very much
@@ -378,7 +382,10 @@ class _EndpointTransformer(Generic[_R, _WR]):
                 elif isinstance(instruction, EndpointHadInstruction):
                     for original_route in original_routes:
                         methods_to_which_we_applied_changes |= original_route.methods
+                        old_path = original_route.path
                         _apply_endpoint_had_instruction(version_change.__name__, instruction, original_route)
+                        if original_route.path != old_path:
+                            route_index.update_path(original_route, old_path)
                     err = (
                         'Endpoint "{endpoint_methods} {endpoint_path}" you tried to change in'
                         ' "{version_change_name}" doesn\'t exist'
@@ -438,31 +445,69 @@ def _apply_endpoint_had_instruction(
     instruction: EndpointHadInstruction,
     original_route: APIRoute,
 ):
-    for attr_name in instruction.attributes.__dataclass_fields__:
-        attr = getattr(instruction.attributes, attr_name)
-        if attr is not Sentinel:
-            if getattr(original_route, attr_name) == attr:
-                raise RouterGenerationError(
-                    f'Expected attribute "{attr_name}" of endpoint'
-                    f' "{list(original_route.methods)} {original_route.path}"'
-                    f' to be different in "{version_change_name}", but it was the same.'
-                    " It means that your version change has no effect on the attribute"
-                    " and can be removed.",
+    attributes = instruction.attributes
+    for attr_name in attributes.__dataclass_fields__:
+        attr = getattr(attributes, attr_name)
+        if attr is Sentinel:
+            continue
+        if getattr(original_route, attr_name) == attr:
+            raise RouterGenerationError(
+                f'Expected attribute "{attr_name}" of endpoint'
+                f' "{list(original_route.methods)} {original_route.path}"'
+                f' to be different in "{version_change_name}", but it was the same.'
+                " It means that your version change has no effect on the attribute"
+                " and can be removed.",
+            )
+        if attr_name == "path":
+            original_path_params = {p.alias for p in original_route.dependant.path_params}
+            new_path_params = set(_PATH_PARAM_PATTERN.findall(attr))
+            if new_path_params != original_path_params:
+                raise RouterPathParamsModifiedError(
+                    f'When altering the path of "{list(original_route.methods)} {original_route.path}" '
+                    f'in "{version_change_name}", you have tried to change its path params '
+                    f'from "{list(original_path_params)}" to "{list(new_path_params)}". It is not allowed to '
+                    "change the path params of a route because the endpoint was created to handle the old path "
+                    "params. In fact, there is no need to change them because the change of path params is "
+                    "not a breaking change. If you really need to change the path params, you should create a "
+                    "new route with the new path params and delete the old one.",
                 )
-            if attr_name == "path":
-                original_path_params = {p.alias for p in original_route.dependant.path_params}
-                new_path_params = set(re.findall("{(.*?)}", attr))
-                if new_path_params != original_path_params:
-                    raise RouterPathParamsModifiedError(
-                        f'When altering the path of "{list(original_route.methods)} {original_route.path}" '
-                        f'in "{version_change_name}", you have tried to change its path params '
-                        f'from "{list(original_path_params)}" to "{list(new_path_params)}". It is not allowed to '
-                        "change the path params of a route because the endpoint was created to handle the old path "
-                        "params. In fact, there is no need to change them because the change of path params is "
-                        "not a breaking change. If you really need to change the path params, you should create a "
-                        "new route with the new path params and delete the old one.",
-                    )
-            setattr(original_route, attr_name, attr)
+        setattr(original_route, attr_name, attr)
+
+
+class _RouteIndex:
+    """Routes grouped by their normalized path so that every instruction doesn't have to scan all of the routes"""
+
+    __slots__ = ("_routes_by_path",)
+
+    def __init__(self, routes: Sequence[BaseRoute]) -> None:
+        super().__init__()
+        self._routes_by_path: defaultdict[str, list[APIRoute]] = defaultdict(list)
+        for route in routes:
+            if isinstance(route, APIRoute):
+                self._routes_by_path[route.path.rstrip("/")].append(route)
+
+    def get_routes(
+        self,
+        endpoint_path: str,
+        endpoint_methods: set[str],
+        endpoint_func_name: str | None = None,
+        *,
+        is_deleted: bool = False,
+    ) -> list[APIRoute]:
+        # All routes in a bucket already share the normalized path so we only need to check the rest
+        return [
+            route
+            for route in self._routes_by_path.get(endpoint_path.rstrip("/"), ())
+            if (
+                route.methods.issubset(endpoint_methods)
+                and (endpoint_func_name is None or route.endpoint.__name__ == endpoint_func_name)
+                and (_DELETED_ROUTE_TAG in route.tags) == is_deleted
+            )
+        ]
+
+    def update_path(self, route: APIRoute, old_path: str) -> None:
+        self._routes_by_path[old_path.rstrip("/")].remove(route)
+        self._routes_by_path[route.path.rstrip("/")].append(route)
 
 
 def _get_routes(
@@ -480,7 +525,7 @@ def _get_routes(
         if (
             isinstance(route, fastapi.routing.APIRoute)
             and route.path.rstrip("/") == endpoint_path
-            and set(route.methods).issubset(endpoint_methods)
+            and route.methods.issubset(endpoint_methods)
             and (endpoint_func_name is None or route.endpoint.__name__ == endpoint_func_name)
             and (_DELETED_ROUTE_TAG in route.tags) == is_deleted
         )
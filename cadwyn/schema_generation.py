@@ -2,6 +2,7 @@ import copy
 import dataclasses
 import functools
 import inspect
+import operator
 import types
 import typing
 from collections.abc import Callable, Sequence
@@ -93,8 +94,8 @@ _all_field_arg_names = sorted(
 EXTRA_FIELD_NAME = "json_schema_extra"
 
 
-_empty_field_info = Field()
-dict_of_empty_field_info = {k: getattr(_empty_field_info, k) for k in FieldInfo.__slots__}
+# Instances of these types can never contain anything that needs to be versioned
+_IMMUTABLE_LEAF_TYPES: frozenset[type] = frozenset({str, bytes, int, float, complex, bool, type(None)})
 
 
 @dataclasses.dataclass(slots=True)
@@ -111,6 +112,11 @@ class PydanticFieldWrapper:
     def __post_init__(self, init_model_field: FieldInfo):
         self.passed_field_attributes = _extract_passed_field_attributes(init_model_field)
 
+    def copy(self) -> Self:
+        result = copy.copy(self)
+        result.passed_field_attributes = self.passed_field_attributes.copy()
+        return result
+
     def update_attribute(self, *, name: str, value: Any):
         self.passed_field_attributes[name] = value
 
@@ -166,21 +172,22 @@ def migrate_response_body(
     """
     if isinstance(version, str):
         version = date.fromisoformat(version)
-    response = ResponseInfo(Response(status_code=200), body=latest_body)
-    migrated_response = versions._migrate_response(
-        response,
-        current_version=version,
-        head_response_model=latest_response_model,
-        path="\0\0\0",
-        method="GET",
+    migrations = versions._get_response_migrations_for_version(
+        latest_response_model, path="\0\0\0", method="GET", current_version=version
     )
+    # A response is only needed to carry the body through migrations so we skip creating it if there are none
+    if migrations:
+        response = ResponseInfo(Response(status_code=200), body=latest_body)
+        migrated_body = versions._migrate_response(response, migrations).body
+    else:
+        migrated_body = latest_body
 
     version = versions._get_closest_lesser_version(version)
 
     versioned_response_model: type[pydantic.BaseModel] = generate_versioned_models(versions)[str(version)][
         latest_response_model
     ]
-    return versioned_response_model.model_validate(migrated_response.body)
+    return versioned_response_model.model_validate(migrated_body)
 
 
 def _unwrap_model(model: type[_T_ANY_MODEL]) -> type[_T_ANY_MODEL]:
@@ -196,11 +203,19 @@ class _ValidatorWrapper:
     decorator: Callable
     is_deleted: bool = False
 
+    def copy(self) -> Self:
+        return copy.copy(self)
+
 
 @dataclasses.dataclass(slots=True, kw_only=True)
 class _PerFieldValidatorWrapper(_ValidatorWrapper):
     fields: list[str]
 
+    def copy(self) -> Self:
+        result = copy.copy(self)
+        result.fields = self.fields.copy()
+        return result
+
 
 def _wrap_validator(func: Callable, is_pydantic_v1_style_validator: Any, decorator_info: _decorators.DecoratorInfo):
     # This is only for pydantic v1 style validators
@@ -300,14 +315,17 @@ class _PydanticModelWrapper(Generic[_T_PYDANTIC_MODEL]):
                 )
 
     def __deepcopy__(self, memo: dict[int, Any]):
+        # We only copy the containers and wrappers that schema migrations mutate. Everything else (field defaults,
+        # validator functions, model config, etc) is never changed in place so it is safe to share between versions.
+        # Annotated metadata is the only exception but __post_init__ already makes fresh copies of it for us
         result = _PydanticModelWrapper(
             self.cls,
             name=self.name,
             doc=self.doc,
-            fields=copy.deepcopy(self.fields),
-            validators=copy.deepcopy(self.validators),
-            other_attributes=copy.deepcopy(self.other_attributes),
-            annotations=copy.deepcopy(self.annotations),
+            fields={name: field.copy() for name, field in self.fields.items()},
+            validators={name: validator.copy() for name, validator in self.validators.items()},
+            other_attributes=self.other_attributes.copy(),
+            annotations=self.annotations.copy(),
         )
         memo[id(self)] = result
         return result
@@ -327,21 +345,18 @@ class _PydanticModelWrapper(Generic[_T_PYDANTIC_MODEL]):
         self._parents = parents
         return parents
 
-    def _get_defined_fields_through_mro(self, schemas: "dict[type, Self]") -> dict[str, PydanticFieldWrapper]:
-        fields = {}
-
-        for parent in reversed(self._get_parents(schemas)):
-            fields |= parent.fields
-
-        return fields | self.fields
+    def _get_defined_field_through_mro(
+        self, field_name: str, schemas: "dict[type, Self]"
+    ) -> tuple[PydanticFieldWrapper, Any] | None:
+        """Find the field and its annotation in the model itself or in its closest parent that defines them.
 
-    def _get_defined_annotations_through_mro(self, schemas: "dict[type, Self]") -> dict[str, Any]:
-        annotations = {}
-
-        for parent in reversed(self._get_parents(schemas)):
-            annotations |= parent.annotations
-
-        return annotations | self.annotations
+        We look up a single name instead of merging the fields of the whole MRO because that's all our callers need.
+        """
+        for model in (self, *self._get_parents(schemas)):
+            if field_name in model.fields:
+                # Every wrapper keeps its fields and annotations in sync so they always come from the same model
+                return model.fields[field_name], model.annotations[field_name]
+        return None
 
     def generate_model_copy(self, generator: "SchemaGenerator") -> type[_T_PYDANTIC_MODEL]:
         per_field_validators = {
@@ -382,19 +397,28 @@ class _CallableWrapper:
     # They are based on putting dependencies (functions) as keys for the dictionary so if we want to be able to
     # override the wrapper, we need to make sure that it is equivalent to the original in __hash__ and __eq__
 
+    # __dict__ stays because update_wrapper copies over arbitrary attributes of the original callable
+    __slots__ = "__dict__", "__globals__", "__weakref__", "__wrapped__", "_original_callable"
+
     def __init__(self, original_callable: Callable) -> None:
         super().__init__()
         self._original_callable = original_callable
         if not is_regular_function(original_callable):
             original_callable = original_callable.__call__
         functools.update_wrapper(self, original_callable)
-
-    @property
-    def __globals__(self):
-        # FastAPI uses __globals__ to resolve forward references in type hints
-        # It's supposed to be an attribute on the function but we use it as property to prevent python
-        # from trying to pickle globals when we deepcopy this wrapper
-        return self._original_callable.__globals__
+        # FastAPI uses __globals__ to resolve forward references in type hints so it is read a lot.
+        # A plain attribute is cheaper than a property but now we have to keep deepcopy away from it.
+        # Callable class instances have no globals so we leave the attribute missing for them too
+        original_globals = getattr(self._original_callable, "__globals__", None)
+        if original_globals is not None:
+            self.__globals__ = original_globals
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> Self:
+        # The wrapper is never changed after we finish creating it so a shallow copy is enough.
+        # A real deepcopy would also try to copy (and thus pickle) the globals of the original callable
+        result = copy.copy(self)
+        memo[id(self)] = result
+        return result
 
     def __call__(self, *args: Any, **kwargs: Any):
         return self._original_callable(*args, **kwargs)
@@ -407,6 +431,8 @@ class _CallableWrapper:
 
 
 class _AsyncCallableWrapper(_CallableWrapper):
+    __slots__ = ()
+
     async def __call__(self, *args: Any, **kwargs: Any):
         return await self._original_callable(*args, **kwargs)
 
@@ -417,10 +443,19 @@ class _AnnotationTransformer:
         # This cache is not here for speeding things up. It's for preventing the creation of copies of the same object
         # because such copies could produce weird behaviors at runtime, especially if you/fastapi do any comparisons.
         # It's defined here and not on the method because of this: https://youtu.be/sVjtp6tGo0g
+        # It is keyed on identity instead of equality because annotations can be unhashable (e.g. set defaults)
+        # and because equality-based caching conflates values such as 1 and True. We store the annotation itself
+        # next to the result to keep it alive so that its id can never be reused by another object.
         self.generator = generator
-        self.change_versions_of_a_non_container_annotation = functools.cache(
-            self._change_version_of_a_non_container_annotation
-        )
+        self._non_container_annotation_cache: dict[int, tuple[Any, Any]] = {}
+
+    def change_versions_of_a_non_container_annotation(self, annotation: Any) -> Any:
+        cached = self._non_container_annotation_cache.get(id(annotation))
+        if cached is not None:
+            return cached[1]
+        result = self._change_version_of_a_non_container_annotation(annotation)
+        self._non_container_annotation_cache[id(annotation)] = (annotation, result)
+        return result
 
     def change_version_of_annotation(self, annotation: Any) -> Any:
         """Recursively go through all annotations and change them to annotations corresponding to the version passed.
@@ -429,14 +464,24 @@ class _AnnotationTransformer:
         replace "UserResponse" with the the same class but from the "2022-11-16" version.
 
         """
-        if isinstance(annotation, dict):
+        annotation_type = type(annotation)
+        if annotation_type in _IMMUTABLE_LEAF_TYPES:
+            return annotation
+        elif annotation_type is list:
+            return [self.change_version_of_annotation(v) for v in annotation]
+        elif annotation_type is tuple:
+            new_annotation = tuple(self.change_version_of_annotation(v) for v in annotation)
+            # Tuples are immutable so there is no reason to return a copy if nothing has changed
+            if all(map(operator.is_, new_annotation, annotation)):
+                return annotation
+            return new_annotation
+        elif isinstance(annotation, dict):
             return {
                 self.change_version_of_annotation(key): self.change_version_of_annotation(value)
                 for key, value in annotation.items()
             }
-
         elif isinstance(annotation, list | tuple):
-            return type(annotation)(self.change_version_of_annotation(v) for v in annotation)
+            return annotation_type(self.change_version_of_annotation(v) for v in annotation)
         else:
             return self.change_versions_of_a_non_container_annotation(annotation)
 
@@ -447,21 +492,26 @@ class _AnnotationTransformer:
             self.migrate_route_to_version(route)
 
     def migrate_route_to_version(self, route: fastapi.routing.APIRoute, *, ignore_response_model: bool = False):
-        if route.response_model is not None and not ignore_response_model:
-            route.response_model = self.change_version_of_annotation(route.response_model)
-            route.response_field = fastapi.utils.create_model_field(
-                name="Response_" + route.unique_id,
-                type_=route.response_model,
-                mode="serialization",
+        create_model_field = fastapi.utils.create_model_field
+        create_cloned_field = fastapi.utils.create_cloned_field
+        # Callbacks are walked iteratively instead of recursing into every one of them
+        routes_to_migrate = [route]
+        while routes_to_migrate:
+            current_route = routes_to_migrate.pop()
+            if current_route.response_model is not None and not ignore_response_model:
+                current_route.response_model = self.change_version_of_annotation(current_route.response_model)
+                current_route.response_field = create_model_field(
+                    name="Response_" + current_route.unique_id,
+                    type_=current_route.response_model,
+                    mode="serialization",
+                )
+                current_route.secure_cloned_response_field = create_cloned_field(current_route.response_field)
+            current_route.dependencies = self.change_version_of_annotation(current_route.dependencies)
+            current_route.endpoint = self.change_version_of_annotation(current_route.endpoint)
+            routes_to_migrate.extend(
+                callback for callback in current_route.callbacks or () if isinstance(callback, fastapi.routing.APIRoute)
             )
-            route.secure_cloned_response_field = fastapi.utils.create_cloned_field(route.response_field)
-        route.dependencies = self.change_version_of_annotation(route.dependencies)
-        route.endpoint = self.change_version_of_annotation(route.endpoint)
-        for callback in route.callbacks or []:
-            if not isinstance(callback, fastapi.routing.APIRoute):
-                continue
-            self.migrate_route_to_version(callback, ignore_response_model=ignore_response_model)
-        self._remake_endpoint_dependencies(route)
+            self._remake_endpoint_dependencies(current_route)
 
     def _change_version_of_a_non_container_annotation(self, annotation: Any) -> Any:
         if isinstance(annotation, _BaseGenericAlias | types.GenericAlias):
@@ -505,7 +555,14 @@ class _AnnotationTransformer:
             return annotation
 
     def _change_version_of_type(self, annotation: type):
-        if lenient_issubclass(annotation, BaseModel | Enum):
+        # Fast path for the most common case: a head model that we have already generated for this version.
+        # Versioned models are built once per version and memoized here, so routes that share a body or response
+        # model never make pydantic rebuild its core schema. FastAPI's own embedded body models are rebuilt per route
+        # in _remake_endpoint_dependencies because their fields come from the route's (already versioned) signature.
+        concrete_model = self.generator.concrete_models.get(annotation)
+        if concrete_model is not None:
+            return concrete_model
+        elif lenient_issubclass(annotation, BaseModel | Enum):
             return self.generator[annotation]
         else:
             return annotation
@@ -594,8 +651,10 @@ class _AnnotationTransformer:
 
     @staticmethod
     def _unwrap_callable(call: Any) -> Any:
-        while hasattr(call, "_original_callable"):
-            call = call._original_callable
+        # Our wrappers are always created around the fully unwrapped callable so this loop
+        # runs at most once per call. We only avoid looking up the attribute twice.
+        while (original_callable := getattr(call, "_original_callable", None)) is not None:
+            call = original_callable
 
         return call
 
@@ -629,10 +688,9 @@ class SchemaGenerator:
             return model
         model = _unwrap_model(model)
 
-        if model in self.concrete_models:
-            return self.concrete_models[model]
-        else:
-            wrapper = self._get_wrapper_for_model(model)
+        concrete_model = self.concrete_models.get(model)
+        if concrete_model is not None:
+            return concrete_model
 
         wrapper = self._get_wrapper_for_model(model)
         model_copy = wrapper.generate_model_copy(self)
@@ -683,6 +741,7 @@ def generate_versioned_models(versions: "VersionBundle") -> "dict[str, SchemaGen
 
 
 def _create_model_bundle(versions: "VersionBundle"):
+    # The head models themselves are never mutated: wrappers copy everything they are going to change
     return _ModelBundle(
         enums={enum: _EnumWrapper(enum) for enum in versions.versioned_enums.values()},
         schemas={schema: _wrap_pydantic_model(schema) for schema in versions.versioned_schemas.values()},
@@ -796,8 +855,7 @@ def _add_field_to_model(
     alter_schema_instruction: FieldExistedAsInstruction,
     version_change_name: str,
 ):
-    defined_fields = model._get_defined_fields_through_mro(schemas)
-    if alter_schema_instruction.name in defined_fields:
+    if model._get_defined_field_through_mro(alter_schema_instruction.name, schemas) is not None:
         raise InvalidGenerationInstructionError(
             f'You tried to add a field "{alter_schema_instruction.name}" to "{model.name}" '
             f'in "{version_change_name}" but there is already a field with that name.',
@@ -816,17 +874,16 @@ def _change_field_in_model(
     alter_schema_instruction: FieldHadInstruction | FieldDidntHaveInstruction,
     version_change_name: str,
 ):
-    defined_annotations = model._get_defined_annotations_through_mro(schemas)
-    defined_fields = model._get_defined_fields_through_mro(schemas)
-    if alter_schema_instruction.name not in defined_fields:
+    defined_field = model._get_defined_field_through_mro(alter_schema_instruction.name, schemas)
+    if defined_field is None:
         raise InvalidGenerationInstructionError(
             f'You tried to change the field "{alter_schema_instruction.name}" from '
             f'"{model.name}" in "{version_change_name}" but it doesn\'t have such a field.',
         )
 
-    field = defined_fields[alter_schema_instruction.name]
+    field, defined_annotation = defined_field
     model.fields[alter_schema_instruction.name] = field
-    model.annotations[alter_schema_instruction.name] = defined_annotations[alter_schema_instruction.name]
+    model.annotations[alter_schema_instruction.name] = defined_annotation
 
     if isinstance(alter_schema_instruction, FieldHadInstruction):
         # TODO: This naming sucks
@@ -834,7 +891,6 @@ def _change_field_in_model(
             model,
             alter_schema_instruction,
             version_change_name,
-            defined_annotations,
             field,
             model.annotations[alter_schema_instruction.name],
         )
@@ -852,7 +908,6 @@ def _change_field(
     model: _PydanticModelWrapper,
     alter_schema_instruction: FieldHadInstruction,
     version_change_name: str,
-    defined_annotations: dict[str, Any],
     field: PydanticFieldWrapper,
     annotation: Any | None,
 ):
@@ -876,20 +931,22 @@ def _change_field(
         model.fields[alter_schema_instruction.new_name] = model.fields.pop(alter_schema_instruction.name)
         model.annotations[alter_schema_instruction.new_name] = model.annotations.pop(
             alter_schema_instruction.name,
-            defined_annotations[alter_schema_instruction.name],
+            annotation,
         )
 
-    for attr_name in alter_schema_instruction.field_changes.__dataclass_fields__:
-        attr_value = getattr(alter_schema_instruction.field_changes, attr_name)
-        if attr_value is not Sentinel:
-            if field.passed_field_attributes.get(attr_name, Sentinel) == attr_value:
-                raise InvalidGenerationInstructionError(
-                    f'You tried to change the attribute "{attr_name}" of field '
-                    f'"{alter_schema_instruction.name}" '
-                    f'from "{model.name}" to {attr_value!r} in "{version_change_name}" '
-                    "but it already has that value.",
-                )
-            field.update_attribute(name=attr_name, value=attr_value)
+    field_changes = alter_schema_instruction.field_changes
+    for attr_name in field_changes.__dataclass_fields__:
+        attr_value = getattr(field_changes, attr_name)
+        if attr_value is Sentinel:
+            continue
+        if field.passed_field_attributes.get(attr_name, Sentinel) == attr_value:
+            raise InvalidGenerationInstructionError(
+                f'You tried to change the attribute "{attr_name}" of field '
+                f'"{alter_schema_instruction.name}" '
+                f'from "{model.name}" to {attr_value!r} in "{version_change_name}" '
+                "but it already has that value.",
+            )
+        field.update_attribute(name=attr_name, value=attr_value)
 
 
 def _delete_field_attributes(
@@ -924,12 +981,13 @@ def _delete_field_from_model(model: _PydanticModelWrapper, field_name: str, vers
         )
     model.fields.pop(field_name)
     model.annotations.pop(field_name)
-    for validator_name, validator in model.validators.copy().items():
+    # We only change the validators themselves, not the dict, so there's no need to iterate over its copy
+    for validator in model.validators.values():
         if isinstance(validator, _PerFieldValidatorWrapper) and field_name in validator.fields:
             validator.fields.remove(field_name)
             # TODO: This behavior doesn't feel natural
             if not validator.fields:
-                model.validators[validator_name].is_deleted = True
+                validator.is_deleted = True
 
 
 class _DummyEnum(Enum):
@@ -946,7 +1004,8 @@ class _EnumWrapper(Generic[_T_ENUM]):
         self.members = {member.name: member.value for member in cls}
 
     def __deepcopy__(self, memo: Any):
-        result = _EnumWrapper(self.cls)
+        # Members are the only thing that migrations change so we don't need to collect them from the enum again
+        result = copy.copy(self)
         result.members = self.members.copy()
         memo[id(self)] = result
         return result
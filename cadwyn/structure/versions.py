@@ -1,11 +1,14 @@
-import email.message
+import bisect
 import functools
 import inspect
+import itertools
 import json
+import operator
 from collections import defaultdict
-from collections.abc import Callable, Iterator, Sequence
+from collections.abc import Awaitable, Callable, Iterator, Sequence
 from contextlib import AsyncExitStack
 from contextvars import ContextVar
+from dataclasses import dataclass
 from datetime import date
 from enum import Enum
 from typing import Any, ClassVar, ParamSpec, TypeAlias, TypeVar
@@ -60,6 +63,26 @@ PossibleInstructions: TypeAlias = (
 )
 APIVersionVarType: TypeAlias = ContextVar[VersionDate | None] | ContextVar[VersionDate]
 IdentifierPythonPath = str
+# None of these instruction types are ever subclassed so we can compare the exact types
+_BODY_INSTRUCTION_TYPES = frozenset(
+    {
+        _AlterRequestBySchemaInstruction,
+        _AlterRequestByPathInstruction,
+        _AlterResponseBySchemaInstruction,
+        _AlterResponseByPathInstruction,
+    }
+)
+_ALLOWED_VERSION_CHANGE_ATTRIBUTE_NAMES = frozenset(
+    {
+        "description",
+        "side_effects",
+        "instructions_to_migrate_to_previous_version",
+        "__module__",
+        "__doc__",
+        "__firstlineno__",
+        "__static_attributes__",
+    }
+)
 
 
 class VersionChange:
@@ -69,13 +92,16 @@ class VersionChange:
     alter_schema_instructions: ClassVar[list[AlterSchemaSubInstruction | SchemaHadInstruction]] = Sentinel
     alter_enum_instructions: ClassVar[list[AlterEnumSubInstruction]] = Sentinel
     alter_endpoint_instructions: ClassVar[list[AlterEndpointSubInstruction]] = Sentinel
-    alter_request_by_schema_instructions: ClassVar[dict[type[BaseModel], list[_AlterRequestBySchemaInstruction]]] = (
+    alter_request_by_schema_instructions: ClassVar[
+        dict[type[BaseModel], tuple[_AlterRequestBySchemaInstruction, ...]]
+    ] = Sentinel
+    alter_request_by_path_instructions: ClassVar[dict[str, tuple[_AlterRequestByPathInstruction, ...]]] = Sentinel
+    alter_response_by_schema_instructions: ClassVar[dict[type, tuple[_AlterResponseBySchemaInstruction, ...]]] = (
         Sentinel
     )
-    alter_request_by_path_instructions: ClassVar[dict[str, list[_AlterRequestByPathInstruction]]] = Sentinel
-    alter_response_by_schema_instructions: ClassVar[dict[type, list[_AlterResponseBySchemaInstruction]]] = Sentinel
-    alter_response_by_path_instructions: ClassVar[dict[str, list[_AlterResponseByPathInstruction]]] = Sentinel
+    alter_response_by_path_instructions: ClassVar[dict[str, tuple[_AlterResponseByPathInstruction, ...]]] = Sentinel
     _bound_version_bundle: "VersionBundle | None"
+    _bound_version_date: VersionDate
 
     def __init_subclass__(cls, _abstract: bool = False) -> None:
         super().__init_subclass__()
@@ -90,27 +116,33 @@ class VersionChange:
 
     @classmethod
     def _extract_body_instructions_into_correct_containers(cls):
+        request_by_schema_instructions: defaultdict[type[BaseModel], list[_AlterRequestBySchemaInstruction]]
+        request_by_schema_instructions = defaultdict(list)
+        request_by_path_instructions: defaultdict[str, list[_AlterRequestByPathInstruction]] = defaultdict(list)
+        response_by_schema_instructions: defaultdict[type, list[_AlterResponseBySchemaInstruction]] = defaultdict(list)
+        response_by_path_instructions: defaultdict[str, list[_AlterResponseByPathInstruction]] = defaultdict(list)
         for instruction in cls.__dict__.values():
             if isinstance(instruction, _AlterRequestBySchemaInstruction):
                 for schema in instruction.schemas:
-                    cls.alter_request_by_schema_instructions[schema].append(instruction)
+                    request_by_schema_instructions[schema].append(instruction)
             elif isinstance(instruction, _AlterRequestByPathInstruction):
-                cls.alter_request_by_path_instructions[instruction.path].append(instruction)
+                request_by_path_instructions[instruction.path].append(instruction)
             elif isinstance(instruction, _AlterResponseBySchemaInstruction):
                 for schema in instruction.schemas:
-                    cls.alter_response_by_schema_instructions[schema].append(instruction)
+                    response_by_schema_instructions[schema].append(instruction)
             elif isinstance(instruction, _AlterResponseByPathInstruction):
-                cls.alter_response_by_path_instructions[instruction.path].append(instruction)
+                response_by_path_instructions[instruction.path].append(instruction)
+        # These containers are never changed after the class is created so we freeze them
+        cls.alter_request_by_schema_instructions = {k: tuple(v) for k, v in request_by_schema_instructions.items()}
+        cls.alter_request_by_path_instructions = {k: tuple(v) for k, v in request_by_path_instructions.items()}
+        cls.alter_response_by_schema_instructions = {k: tuple(v) for k, v in response_by_schema_instructions.items()}
+        cls.alter_response_by_path_instructions = {k: tuple(v) for k, v in response_by_path_instructions.items()}
 
     @classmethod
     def _extract_list_instructions_into_correct_containers(cls):
         cls.alter_schema_instructions = []
         cls.alter_enum_instructions = []
         cls.alter_endpoint_instructions = []
-        cls.alter_request_by_schema_instructions = defaultdict(list)
-        cls.alter_request_by_path_instructions = defaultdict(list)
-        cls.alter_response_by_schema_instructions = defaultdict(list)
-        cls.alter_response_by_path_instructions = defaultdict(list)
         for alter_instruction in cls.instructions_to_migrate_to_previous_version:
             if isinstance(alter_instruction, SchemaHadInstruction | AlterSchemaSubInstruction):
                 cls.alter_schema_instructions.append(alter_instruction)
@@ -144,21 +176,10 @@ class VersionChange:
                     f"Instruction '{instruction}' is not allowed. Please, use the correct instruction types",
                 )
         for attr_name, attr_value in cls.__dict__.items():
-            if not isinstance(
-                attr_value,
-                _AlterRequestBySchemaInstruction
-                | _AlterRequestByPathInstruction
-                | _AlterResponseBySchemaInstruction
-                | _AlterResponseByPathInstruction,
-            ) and attr_name not in {
-                "description",
-                "side_effects",
-                "instructions_to_migrate_to_previous_version",
-                "__module__",
-                "__doc__",
-                "__firstlineno__",
-                "__static_attributes__",
-            }:
+            if (
+                type(attr_value) not in _BODY_INSTRUCTION_TYPES
+                and attr_name not in _ALLOWED_VERSION_CHANGE_ATTRIBUTE_NAMES
+            ):
                 raise CadwynStructureError(
                     f"Found: '{attr_name}' attribute of type '{type(attr_value)}' in '{cls.__name__}'."
                     " Only migration instructions and schema properties are allowed in version change class body.",
@@ -166,7 +187,7 @@ class VersionChange:
 
     @classmethod
     def _check_no_subclassing(cls):
-        if cls.mro() != [cls, VersionChange, object]:
+        if cls.__mro__ != (cls, VersionChange, object):
             raise TypeError(
                 f"Can't subclass {cls.__name__} as it was never meant to be subclassed.",
             )
@@ -180,24 +201,21 @@ class VersionChange:
 class VersionChangeWithSideEffects(VersionChange, _abstract=True):
     @classmethod
     def _check_no_subclassing(cls):
-        if cls.mro() != [cls, VersionChangeWithSideEffects, VersionChange, object]:
+        if cls.__mro__ != (cls, VersionChangeWithSideEffects, VersionChange, object):
             raise TypeError(
                 f"Can't subclass {cls.__name__} as it was never meant to be subclassed.",
             )
 
     @classproperty
     def is_applied(cls: type["VersionChangeWithSideEffects"]) -> bool:  # pyright: ignore[reportGeneralTypeIssues]
-        if (
-            cls._bound_version_bundle is None
-            or cls not in cls._bound_version_bundle._version_changes_to_version_mapping
-        ):
+        if cls._bound_version_bundle is None:
             raise CadwynError(
                 f"You tried to check whether '{cls.__name__}' is active but it was never bound to any version.",
             )
         api_version = cls._bound_version_bundle.api_version_var.get()
         if api_version is None:
             return True
-        return cls._bound_version_bundle._version_changes_to_version_mapping[cls] <= api_version
+        return cls._bound_version_date <= api_version
 
 
 class Version:
@@ -242,6 +260,46 @@ class HeadVersion:
         return self.changes
 
 
+@dataclass(slots=True)
+class _VersionDataConverters:
+    """Data converters of a single version flattened out of their per-path/per-schema containers"""
+
+    by_path: list[tuple[type[VersionChange], _AlterRequestByPathInstruction | _AlterResponseByPathInstruction]]
+    # Each by-schema converter also carries a frozenset of its schemas for the usage checks in route generation
+    request_by_schema: list[tuple[type[VersionChange], _AlterRequestBySchemaInstruction, frozenset[Any]]]
+    response_by_schema: list[tuple[type[VersionChange], _AlterResponseBySchemaInstruction, frozenset[Any]]]
+
+
+def _flatten_data_converters(version: Version) -> _VersionDataConverters:
+    converters = _VersionDataConverters(by_path=[], request_by_schema=[], response_by_schema=[])
+    for version_change in version.changes:
+        for by_path_converters in [
+            *version_change.alter_response_by_path_instructions.values(),
+            *version_change.alter_request_by_path_instructions.values(),
+        ]:
+            converters.by_path.extend((version_change, converter) for converter in by_path_converters)
+        # A converter for several schemas is stored once per schema so we deduplicate them here
+        request_by_schema_converters = {
+            id(converter): converter
+            for by_schema_converters in version_change.alter_request_by_schema_instructions.values()
+            for converter in by_schema_converters
+        }
+        converters.request_by_schema.extend(
+            (version_change, converter, frozenset(converter.schemas))
+            for converter in request_by_schema_converters.values()
+        )
+        response_by_schema_converters = {
+            id(converter): converter
+            for by_schema_converters in version_change.alter_response_by_schema_instructions.values()
+            for converter in by_schema_converters
+        }
+        converters.response_by_schema.extend(
+            (version_change, converter, frozenset(converter.schemas))
+            for converter in response_by_schema_converters.values()
+        )
+    return converters
+
+
 def get_cls_pythonpath(cls: type) -> IdentifierPythonPath:
     return f"{cls.__module__}.{cls.__name__}"
 
@@ -267,10 +325,12 @@ class VersionBundle:
         if api_version_var is None:
             api_version_var = ContextVar("cadwyn_api_version")
         self.api_version_var = api_version_var
-        if sorted(self.versions, key=lambda v: v.value, reverse=True) != list(self.versions):
+        # Equal neighbours are allowed here because they get a more specific error below
+        if any(newer.value < older.value for newer, older in itertools.pairwise(self.versions)):
             raise CadwynStructureError(
                 "Versions are not sorted correctly. Please sort them in descending order.",
             )
+        self._ascending_version_dates = self.version_dates[::-1]
         if not self.versions:
             raise CadwynStructureError("You must define at least one non-head version in a VersionBundle.")
         if self.versions[-1].changes:
@@ -295,6 +355,14 @@ class VersionBundle:
                         "It is prohibited.",
                     )
                 version_change._bound_version_bundle = self
+                version_change._bound_version_date = version.value
+        self._request_migrations_cache: dict[
+            tuple[type[BaseModel] | None, str, str],
+            tuple[list[VersionDate], list[_AlterRequestBySchemaInstruction | _AlterRequestByPathInstruction]],
+        ] = {}
+        self._response_migrations_cache: dict[
+            tuple[type[BaseModel] | None, str, str], tuple[list[VersionDate], list[_BaseAlterResponseInstruction]]
+        ] = {}
 
     def __iter__(self) -> Iterator[Version]:
         yield from self.versions
@@ -305,42 +373,113 @@ class VersionBundle:
 
     @functools.cached_property
     def versioned_schemas(self) -> dict[IdentifierPythonPath, type[VersionedModel]]:
-        altered_schemas = {
-            get_cls_pythonpath(instruction.schema): instruction.schema
-            for version in self._all_versions
-            for version_change in version.changes
-            for instruction in list(version_change.alter_schema_instructions)
-        }
-
-        migrated_schemas = {
-            get_cls_pythonpath(schema): schema
-            for version in self._all_versions
-            for version_change in version.changes
-            for schema in list(version_change.alter_request_by_schema_instructions.keys())
-        }
-
-        return altered_schemas | migrated_schemas
+        return self._versioned_schemas_and_enums[0]
 
     @functools.cached_property
     def versioned_enums(self) -> dict[IdentifierPythonPath, type[Enum]]:
-        return {
-            get_cls_pythonpath(instruction.enum): instruction.enum
-            for version in self._all_versions
-            for version_change in version.changes
-            for instruction in version_change.alter_enum_instructions
-        }
+        return self._versioned_schemas_and_enums[1]
+
+    @functools.cached_property
+    def _versioned_schemas_and_enums(
+        self,
+    ) -> tuple[dict[IdentifierPythonPath, type[VersionedModel]], dict[IdentifierPythonPath, type[Enum]]]:
+        altered_schemas: dict[IdentifierPythonPath, type[VersionedModel]] = {}
+        migrated_schemas: dict[IdentifierPythonPath, type[VersionedModel]] = {}
+        enums: dict[IdentifierPythonPath, type[Enum]] = {}
+        for version in self._all_versions:
+            for version_change in version.changes:
+                for instruction in version_change.alter_schema_instructions:
+                    altered_schemas[get_cls_pythonpath(instruction.schema)] = instruction.schema
+                for schema in version_change.alter_request_by_schema_instructions:
+                    migrated_schemas[get_cls_pythonpath(schema)] = schema
+                for instruction in version_change.alter_enum_instructions:
+                    enums[get_cls_pythonpath(instruction.enum)] = instruction.enum
+
+        return altered_schemas | migrated_schemas, enums
 
     def _get_closest_lesser_version(self, version: VersionDate):
-        for defined_version in self.version_dates:
-            if defined_version <= version:
-                return defined_version
+        closest_version_index = bisect.bisect_right(self._ascending_version_dates, version) - 1
+        if closest_version_index >= 0:
+            return self._ascending_version_dates[closest_version_index]
         raise CadwynError("You tried to migrate to version that is earlier than the first version which is prohibited.")
 
     @functools.cached_property
-    def _version_changes_to_version_mapping(
-        self,
-    ) -> dict[type[VersionChange] | type[VersionChangeWithSideEffects], VersionDate]:
-        return {version_change: version.value for version in self.versions for version_change in version.changes}
+    def _data_converters_per_version(self) -> dict[VersionDate, _VersionDataConverters]:
+        return {version.value: _flatten_data_converters(version) for version in self.versions}
+
+    @functools.cached_property
+    def _paths_and_schemas_with_request_migrations(self) -> tuple[set[str], set[type[BaseModel]]]:
+        paths: set[str] = set()
+        schemas: set[type[BaseModel]] = set()
+        for version in self.versions:
+            for version_change in version.changes:
+                paths.update(version_change.alter_request_by_path_instructions)
+                schemas.update(version_change.alter_request_by_schema_instructions)
+        return paths, schemas
+
+    @functools.cached_property
+    def _paths_and_schemas_with_response_migrations(self) -> tuple[set[str], set[Any]]:
+        paths: set[str] = set()
+        schemas: set[Any] = set()
+        for version in self.versions:
+            for version_change in version.changes:
+                paths.update(version_change.alter_response_by_path_instructions)
+                schemas.update(version_change.alter_response_by_schema_instructions)
+        return paths, schemas
+
+    def _get_request_migrations(
+        self, body_type: type[BaseModel] | None, path: str, method: str
+    ) -> tuple[list[VersionDate], list[_AlterRequestBySchemaInstruction | _AlterRequestByPathInstruction]]:
+        """Get all request migrations for the route in the order of application with the versions they belong to.
+
+        Versions go in ascending order so the migrations for a client version start right after it.
+        """
+        key = (body_type, path, method)
+        if key in self._request_migrations_cache:
+            return self._request_migrations_cache[key]
+        migration_versions: list[VersionDate] = []
+        migrations: list[_AlterRequestBySchemaInstruction | _AlterRequestByPathInstruction] = []
+        for v in reversed(self.versions):
+            for version_change in v.changes:
+                if body_type is not None and body_type in version_change.alter_request_by_schema_instructions:
+                    for instruction in version_change.alter_request_by_schema_instructions[body_type]:
+                        migration_versions.append(v.value)
+                        migrations.append(instruction)
+                if path in version_change.alter_request_by_path_instructions:
+                    for instruction in version_change.alter_request_by_path_instructions[path]:
+                        if method in instruction.methods:  # pragma: no branch # safe branch to skip
+                            migration_versions.append(v.value)
+                            migrations.append(instruction)
+        self._request_migrations_cache[key] = migration_versions, migrations
+        return migration_versions, migrations
+
+    def _get_response_migrations(
+        self, head_response_model: type[BaseModel] | None, path: str, method: str
+    ) -> tuple[list[VersionDate], list[_BaseAlterResponseInstruction]]:
+        """Get all response migrations for the route in the order of application with the versions they belong to.
+
+        Migrations go from the newest version to the oldest one but their versions are returned in reverse
+        (ascending) order so that they can be bisected.
+        """
+        key = (head_response_model, path, method)
+        if key in self._response_migrations_cache:
+            return self._response_migrations_cache[key]
+        migration_versions: list[VersionDate] = []
+        migrations: list[_BaseAlterResponseInstruction] = []
+        for v in self.versions:
+            for version_change in v.changes:
+                if head_response_model and head_response_model in version_change.alter_response_by_schema_instructions:
+                    for instruction in version_change.alter_response_by_schema_instructions[head_response_model]:
+                        migration_versions.append(v.value)
+                        migrations.append(instruction)
+                if path in version_change.alter_response_by_path_instructions:
+                    for instruction in version_change.alter_response_by_path_instructions[path]:
+                        if method in instruction.methods:  # pragma: no branch # Safe branch to skip
+                            migration_versions.append(v.value)
+                            migrations.append(instruction)
+        migration_versions.reverse()
+        self._response_migrations_cache[key] = migration_versions, migrations
+        return migration_versions, migrations
 
     async def _migrate_request(
         self,
@@ -357,20 +496,17 @@ class VersionBundle:
         embed_body_fields: bool,
         background_tasks: BackgroundTasks | None,
     ) -> dict[str, Any]:
-        method = request.method
-        for v in reversed(self.versions):
-            if v.value <= current_version:
-                continue
-            for version_change in v.changes:
-                if body_type is not None and body_type in version_change.alter_request_by_schema_instructions:
-                    for instruction in version_change.alter_request_by_schema_instructions[body_type]:
-                        instruction(request_info)
-                if path in version_change.alter_request_by_path_instructions:
-                    for instruction in version_change.alter_request_by_path_instructions[path]:
-                        if method in instruction.methods:  # pragma: no branch # safe branch to skip
-                            instruction(request_info)
-        request.scope["headers"] = tuple((key.encode(), value.encode()) for key, value in request_info.headers.items())
-        del request._headers
+        paths_with_migrations, schemas_with_migrations = self._paths_and_schemas_with_request_migrations
+        # Most routes have no request migrations at all so we avoid looking them up for such routes
+        if path in paths_with_migrations or body_type in schemas_with_migrations:
+            migration_versions, migrations = self._get_request_migrations(body_type, path, request.method)
+            migrations_to_apply = migrations[bisect.bisect_right(migration_versions, current_version) :]
+            for instruction in migrations_to_apply:
+                instruction(request_info)
+            # Headers can only change if we ran any migrations. When we did, their raw form is already encoded
+            if migrations_to_apply:
+                request.scope["headers"] = request_info.headers.raw
+                del request._headers
         # Remember this: if len(body_params) == 1, then route.body_schema == route.dependant.body_params[0]
         result = await solve_dependencies(
             request=request,
@@ -388,33 +524,29 @@ class VersionBundle:
             )
         return result.values
 
-    def _migrate_response(
+    def _get_response_migrations_for_version(
         self,
-        response_info: ResponseInfo,
-        current_version: VersionDate,
-        head_response_model: type[BaseModel],
+        head_response_model: type[BaseModel] | None,
         path: str,
         method: str,
-    ) -> ResponseInfo:
-        for v in self.versions:
-            if v.value <= current_version:
-                break
-            for version_change in v.changes:
-                migrations_to_apply: list[_BaseAlterResponseInstruction] = []
-
-                if head_response_model and head_response_model in version_change.alter_response_by_schema_instructions:
-                    migrations_to_apply.extend(
-                        version_change.alter_response_by_schema_instructions[head_response_model]
-                    )
-
-                if path in version_change.alter_response_by_path_instructions:
-                    for instruction in version_change.alter_response_by_path_instructions[path]:
-                        if method in instruction.methods:  # pragma: no branch # Safe branch to skip
-                            migrations_to_apply.append(instruction)  # noqa: PERF401
+        current_version: VersionDate,
+    ) -> Sequence[_BaseAlterResponseInstruction]:
+        paths_with_migrations, schemas_with_migrations = self._paths_and_schemas_with_response_migrations
+        # Most routes have no response migrations at all so we avoid looking them up for such routes
+        if path not in paths_with_migrations and head_response_model not in schemas_with_migrations:
+            return ()
+        migration_versions, migrations = self._get_response_migrations(head_response_model, path, method)
+        skipped_migrations_count = bisect.bisect_right(migration_versions, current_version)
+        return migrations[: len(migrations) - skipped_migrations_count]
 
-                for migration in migrations_to_apply:
-                    if response_info.status_code < 300 or migration.migrate_http_errors:
-                        migration(response_info)
+    def _migrate_response(
+        self,
+        response_info: ResponseInfo,
+        migrations: Sequence[_BaseAlterResponseInstruction],
+    ) -> ResponseInfo:
+        for migration in migrations:
+            if response_info.status_code < 300 or migration.migrate_http_errors:
+                migration(response_info)
         return response_info
 
     # TODO (https://github.com/zmievsa/cadwyn/issues/113): Refactor this function and all functions it calls.
@@ -431,14 +563,22 @@ class VersionBundle:
         response_param_name: str,
     ) -> Callable[[Endpoint[_P, _R]], Endpoint[_P, _R]]:
         def wrapper(endpoint: Endpoint[_P, _R]) -> Endpoint[_P, _R]:
+            # Sync endpoints are run in a threadpool just like FastAPI does it
+            run_endpoint: Callable[..., Awaitable[Any]] = (
+                endpoint if is_async_callable(endpoint) else functools.partial(run_in_threadpool, endpoint)
+            )
+            get_request_and_response_params = operator.itemgetter(request_param_name, response_param_name)
+
             @functools.wraps(endpoint)
             async def decorator(*args: Any, **kwargs: Any) -> _R:
-                request_param: FastapiRequest = kwargs[request_param_name]
-                response_param: FastapiResponse = kwargs[response_param_name]
+                request_param: FastapiRequest
+                response_param: FastapiResponse
+                request_param, response_param = get_request_and_response_params(kwargs)
                 background_tasks: BackgroundTasks | None = kwargs.get(
                     background_tasks_param_name,  # pyright: ignore[reportArgumentType]
                 )
                 method = request_param.method
+                api_version = self.api_version_var.get()
                 response = Sentinel
                 async with AsyncExitStack() as exit_stack:
                     kwargs = await self._convert_endpoint_kwargs_to_version(
@@ -452,19 +592,21 @@ class VersionBundle:
                         response_param,
                         route,
                         head_route,
+                        api_version=api_version,
                         exit_stack=exit_stack,
                         embed_body_fields=route._embed_body_fields,
                         background_tasks=background_tasks,
                     )
 
                     response = await self._convert_endpoint_response_to_version(
-                        endpoint,
+                        run_endpoint,
                         head_route,
                         route,
                         method,
                         response_param_name,
                         kwargs,
                         response_param,
+                        api_version=api_version,
                     )
                 if response is Sentinel:  # pragma: no cover
                     raise CadwynError(
@@ -488,45 +630,55 @@ class VersionBundle:
     # TODO: Simplify it
     async def _convert_endpoint_response_to_version(  # noqa: C901
         self,
-        func_to_get_response_from: Endpoint,
+        run_endpoint: Callable[..., Awaitable[Any]],
         head_route: APIRoute,
         route: APIRoute,
         method: str,
         response_param_name: str,
         kwargs: dict[str, Any],
         fastapi_response_dependency: FastapiResponse,
+        *,
+        api_version: VersionDate | None,
     ) -> Any:
         raised_exception = None
         if response_param_name == _CADWYN_RESPONSE_PARAM_NAME:
             kwargs.pop(response_param_name)
         try:
-            if is_async_callable(func_to_get_response_from):
-                response_or_response_body: FastapiResponse | object = await func_to_get_response_from(**kwargs)
-            else:
-                response_or_response_body: FastapiResponse | object = await run_in_threadpool(
-                    func_to_get_response_from,
-                    **kwargs,
-                )
+            response_or_response_body: FastapiResponse | object = await run_endpoint(**kwargs)
         except HTTPException as exc:
             raised_exception = exc
+            # The body is only going to be used in its python form so we do not serialize it here
             response_or_response_body = FastapiResponse(
-                content=json.dumps({"detail": raised_exception.detail}),
                 status_code=raised_exception.status_code,
                 headers=raised_exception.headers,
             )
-        api_version = self.api_version_var.get()
         if api_version is None:
+            # There is nothing to migrate so FastAPI can handle the exception itself
+            if raised_exception is not None:
+                raise raised_exception
             return response_or_response_body
 
+        migrations = self._get_response_migrations_for_version(
+            head_route.response_model, route.path, method, api_version
+        )
         if isinstance(response_or_response_body, FastapiResponse):
+            # Parsing and re-rendering the body is only worth it if a migration is going to run. Until one runs,
+            # the status code stays the same so we can tell in advance whether error migrations matter
+            status_code = response_or_response_body.status_code
+            if not any(status_code < 300 or migration.migrate_http_errors for migration in migrations):
+                if raised_exception is not None:
+                    raise raised_exception
+                return response_or_response_body
             # TODO (https://github.com/zmievsa/cadwyn/issues/125): Add support for migrating `StreamingResponse`
             # TODO (https://github.com/zmievsa/cadwyn/issues/126): Add support for migrating `FileResponse`
             # Starlette breaks Liskov Substitution principle and
             # doesn't define `body` for `StreamingResponse` and `FileResponse`
             if isinstance(response_or_response_body, StreamingResponse | FileResponse):
                 body = None
+            elif raised_exception is not None:
+                body = {"detail": raised_exception.detail}
             elif response_or_response_body.body:
-                if (isinstance(response_or_response_body, JSONResponse) or raised_exception is not None) and isinstance(
+                if isinstance(response_or_response_body, JSONResponse) and isinstance(
                     response_or_response_body.body, str | bytes
                 ):
                     body = json.loads(response_or_response_body.body)
@@ -536,10 +688,11 @@ class VersionBundle:
                     body = response_or_response_body.body
             else:
                 body = None
-                # TODO (https://github.com/zmievsa/cadwyn/issues/51): Only do this if there are migrations
 
             response_info = ResponseInfo(response_or_response_body, body)
         else:
+            # Plain return values must be dumped even if no migration applies: FastAPI would otherwise validate
+            # the head model instance against the versioned response model which is a different class
             if fastapi_response_dependency.status_code is not None:  # pyright: ignore[reportUnnecessaryComparison]
                 status_code = fastapi_response_dependency.status_code
             elif route.status_code is not None:
@@ -559,13 +712,7 @@ class VersionBundle:
                 ),
             )
 
-        response_info = self._migrate_response(
-            response_info,
-            api_version,
-            head_route.response_model,
-            route.path,
-            method,
-        )
+        response_info = self._migrate_response(response_info, migrations)
         if isinstance(response_or_response_body, FastapiResponse):
             # a webserver (uvicorn for instance) calculates the body at the endpoint level.
             # if an endpoint returns no "body", its content-length will be set to 0
@@ -578,27 +725,30 @@ class VersionBundle:
             # We skip cases without "body" attribute because of StreamingResponse and FileResponse
             # that do not have it. We don't support it too.
             if response_info.body is not None and hasattr(response_info._response, "body"):
-                # TODO (https://github.com/zmievsa/cadwyn/issues/51): Only do this if there are migrations
-                if (
+                # Migrations can set an already rendered body which we send as is
+                if isinstance(response_info.body, bytes | bytearray | memoryview):
+                    rendered_body = bytes(response_info.body)
+                elif (
                     isinstance(response_info.body, str)
                     and response_info._response.headers.get("content-type") != "application/json"
                 ):
-                    response_info._response.body = response_info.body.encode(response_info._response.charset)
+                    rendered_body = response_info.body.encode(response_info._response.charset)
                 else:
-                    response_info._response.body = json.dumps(
+                    rendered_body = json.dumps(
                         response_info.body,
                         ensure_ascii=False,
                         allow_nan=False,
                         indent=None,
                         separators=(",", ":"),
                     ).encode("utf-8")
+                response_info._response.body = rendered_body
                 # It makes sense to re-calculate content length because the previously calculated one
                 # might slightly differ. If it differs -- uvicorn will break.
-                response_info.headers["content-length"] = str(len(response_info._response.body))
+                response_info.headers["content-length"] = str(len(rendered_body))
 
             if raised_exception is not None and response_info.status_code >= 400:
-                if isinstance(response_info.body, dict) and "detail" in response_info.body:
-                    detail = response_info.body["detail"]
+                if isinstance(response_info.body, dict):
+                    detail = response_info.body.get("detail", response_info.body)
                 else:
                     detail = response_info.body
 
@@ -621,6 +771,7 @@ class VersionBundle:
         route: APIRoute,
         head_route: APIRoute,
         *,
+        api_version: VersionDate | None,
         exit_stack: AsyncExitStack,
         embed_body_fields: bool,
         background_tasks: BackgroundTasks | None,
@@ -629,16 +780,16 @@ class VersionBundle:
         if request_param_name == _CADWYN_REQUEST_PARAM_NAME:
             kwargs.pop(request_param_name)
 
-        api_version = self.api_version_var.get()
         if api_version is None:
             return kwargs
 
-        # This is a kind of body param you get when you define a single pydantic schema in your route's body
+        # This is a kind of body param you get when you define a single pydantic schema in your route's body.
+        # head_body_field is only set for such routes during route generation so we check it before the dependant
         if (
-            len(route.dependant.body_params) == 1
-            and head_body_field is not None
+            head_body_field is not None
             and body_field_alias is not None
             and body_field_alias in kwargs
+            and len(route.dependant.body_params) == 1
         ):
             raw_body: BaseModel | None = kwargs.get(body_field_alias)
             if raw_body is None:  # pragma: no cover # This is likely an impossible case but we would like to be safe
@@ -668,12 +819,20 @@ class VersionBundle:
             background_tasks=background_tasks,
         )
         # Because we re-added it into our kwargs when we did solve_dependencies
-        if _CADWYN_REQUEST_PARAM_NAME in new_kwargs:
-            new_kwargs.pop(_CADWYN_REQUEST_PARAM_NAME)
+        new_kwargs.pop(_CADWYN_REQUEST_PARAM_NAME, None)
 
         return new_kwargs
 
 
+def _is_json_content_type(content_type: str) -> bool:
+    # Parses the header the same way as email.message.Message does it but without building a whole message
+    media_type = content_type.partition(";")[0].strip().lower()
+    if media_type.count("/") != 1:
+        return False
+    maintype, _, subtype = media_type.partition("/")
+    return maintype == "application" and (subtype == "json" or subtype.endswith("+json"))
+
+
 # We use this instead of `.body()` to automatically guess body type and load the correct body, even if it's a form
 async def _get_body(
     request: FastapiRequest, body_field: ModelField | None, exit_stack: AsyncExitStack
@@ -690,15 +849,8 @@ async def _get_body(
                 if body_bytes:
                     json_body: Any = PydanticUndefined
                     content_type_value = request.headers.get("content-type")
-                    if not content_type_value:
+                    if not content_type_value or _is_json_content_type(content_type_value):
                         json_body = await request.json()
-                    else:
-                        message = email.message.Message()
-                        message["content-type"] = content_type_value
-                        if message.get_content_maintype() == "application":
-                            subtype = message.get_content_subtype()
-                            if subtype == "json" or subtype.endswith("+json"):
-                                json_body = await request.json()
                     if json_body != PydanticUndefined:
                         body = json_body
                     else:
@@ -728,12 +880,11 @@ def _add_keyword_only_parameter(
     param_name: str,
     param_annotation: type,
 ):
-    signature = inspect.signature(func)
+    # We usually add two parameters to the same function so the second time we can reuse the signature we've built
+    signature: inspect.Signature = getattr(func, "__signature__", None) or inspect.signature(func)
     func.__signature__ = signature.replace(
         parameters=(
-            [
-                *list(signature.parameters.values()),
-                inspect.Parameter(param_name, kind=inspect._ParameterKind.KEYWORD_ONLY, annotation=param_annotation),
-            ]
+            *signature.parameters.values(),
+            inspect.Parameter(param_name, kind=inspect._ParameterKind.KEYWORD_ONLY, annotation=param_annotation),
         ),
     )
@@ -4,7 +4,6 @@ from datetime import date
 
 import uvicorn
 from fastapi import FastAPI
-from fastapi.testclient import TestClient
 
 from cadwyn import Cadwyn
 from cadwyn.structure.versions import Version, VersionBundle
@@ -31,9 +30,5 @@ versioned_app_with_custom_api_version_var.add_header_versioned_routers(v2021_01_
 versioned_app_with_custom_api_version_var.add_header_versioned_routers(v2022_01_02_router, header_value="2022-02-02")
 versioned_app_with_custom_api_version_var.include_router(unversioned_router)
 
-# TODO: We should not have any clients that are run like this. Instead, all of them must run using "with"
-client_without_headers = TestClient(versioned_app)
-client_without_headers_and_with_custom_api_version_var = TestClient(versioned_app_with_custom_api_version_var)
-
 if __name__ == "__main__":
     uvicorn.run(versioned_app)
@@ -21,6 +21,7 @@ from cadwyn.structure.endpoints import AlterEndpointSubInstruction
 from cadwyn.structure.enums import AlterEnumSubInstruction
 from cadwyn.structure.schemas import AlterSchemaSubInstruction, SchemaHadInstruction
 from cadwyn.structure.versions import HeadVersion
+from tests._resources.versioned_app.app import versioned_app, versioned_app_with_custom_api_version_var
 
 CURRENT_DIR = Path(__file__).parent
 Undefined = object()
@@ -38,6 +39,18 @@ def random_uuid():
     return uuid.uuid4()
 
 
+@pytest.fixture(scope="session")
+def client_without_headers():
+    with TestClient(versioned_app) as client:
+        yield client
+
+
+@pytest.fixture(scope="session")
+def client_without_headers_and_with_custom_api_version_var():
+    with TestClient(versioned_app_with_custom_api_version_var) as client:
+        yield client
+
+
 class CadwynTestClient(TestClient):
     @same_definition_as_in(TestClient.__init__)
     def __init__(self, *args: Any, **kwargs: Any) -> None:
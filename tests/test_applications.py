@@ -14,12 +14,7 @@ from cadwyn.structure.endpoints import endpoint
 from cadwyn.structure.schemas import schema
 from cadwyn.structure.versions import HeadVersion, Version, VersionBundle, VersionChange
 from tests._resources.utils import BASIC_HEADERS, DEFAULT_API_VERSION
-from tests._resources.versioned_app.app import (
-    client_without_headers,
-    client_without_headers_and_with_custom_api_version_var,
-    v2021_01_01_router,
-    v2022_01_02_router,
-)
+from tests._resources.versioned_app.app import v2021_01_01_router, v2022_01_02_router
 
 
 def test__header_routing__invalid_version_format__error():
@@ -141,8 +136,11 @@ def test__header_routing_fastapi_add_header_versioned_routers__apirouter_is_empt
     assert route.path == "/openapi.json"
 
 
-@pytest.mark.parametrize("client", [client_without_headers, client_without_headers_and_with_custom_api_version_var])
-def test__header_based_versioning(client: TestClient):
+@pytest.mark.parametrize(
+    "client_fixture_name", ["client_without_headers", "client_without_headers_and_with_custom_api_version_var"]
+)
+def test__header_based_versioning(client_fixture_name: str, request: pytest.FixtureRequest):
+    client: TestClient = request.getfixturevalue(client_fixture_name)
     resp = client.get("/v1", headers=BASIC_HEADERS)
     assert resp.status_code == 200
     assert resp.json() == {"my_version1": 1}
@@ -159,19 +157,19 @@ def test__header_based_versioning(client: TestClient):
     assert resp.headers["X-API-VERSION"] == "2024-02-02"
 
 
-def test__header_based_versioning__invalid_version_header_format__should_raise_422():
+def test__header_based_versioning__invalid_version_header_format__should_raise_422(client_without_headers: TestClient):
     resp = client_without_headers.get("/v1", headers=BASIC_HEADERS | {"X-API-VERSION": "2022-02_02"})
     assert resp.status_code == 422
     assert resp.json()[0]["loc"] == ["header", "x-api-version"]
 
 
-def test__get_unversioned_router():
+def test__get_unversioned_router(client_without_headers: TestClient):
     resp = client_without_headers.post("/v1/unversioned")
     assert resp.status_code == 200
     assert resp.json() == {"saved": True}
 
 
-def test__get_openapi():
+def test__get_openapi(client_without_headers: TestClient):
     resp = client_without_headers.get("/openapi.json", headers={"x-api-version": "2021-01-01"})
     assert resp.status_code == 200
 
@@ -179,7 +177,7 @@ def test__get_openapi():
     assert resp.status_code == 200
 
 
-def test__get_openapi__nonexisting_version__error():
+def test__get_openapi__nonexisting_version__error(client_without_headers: TestClient):
     resp = client_without_headers.get("/openapi.json?version=2023-01-01")
     assert resp.status_code == 404
     assert resp.json() == {"detail": "OpenApi file of with version `2023-01-01` not found"}
@@ -249,7 +247,7 @@ def test__get_docs__with_unversioned_routes__should_return_all_versioned_doc_url
 
 
 # I wish we could check it properly but it's a dynamic page and I'm not in the mood of adding selenium
-def test__get_docs__specific_version():
+def test__get_docs__specific_version(client_without_headers: TestClient):
     resp = client_without_headers.get("/docs?version=2022-01-01")
     assert resp.status_code == 200
 
@@ -257,18 +255,18 @@ def test__get_docs__specific_version():
     assert resp.status_code == 200
 
 
-def test__get_unversioned_with_redirect():
+def test__get_unversioned_with_redirect(client_without_headers: TestClient):
     resp = client_without_headers.post("/v1/unversioned/")
     assert resp.status_code == 200
     assert resp.json() == {"saved": True}
 
 
-def test__get_unversioned_as_partial_because_of_method():
+def test__get_unversioned_as_partial_because_of_method(client_without_headers: TestClient):
     resp = client_without_headers.patch("/v1/unversioned")
     assert resp.status_code == 405
 
 
-def test__empty_root():
+def test__empty_root(client_without_headers: TestClient):
     resp = client_without_headers.get("/")
     assert resp.status_code == 404
 
@@ -9,7 +9,7 @@ from typing import Any, Literal
 import fastapi
 import pytest
 from dirty_equals import IsPartialDict, IsStr
-from fastapi import APIRouter, Body, Cookie, File, Header, HTTPException, Query, Request, Response, UploadFile
+from fastapi import APIRouter, Body, Cookie, Depends, File, Header, HTTPException, Query, Request, Response, UploadFile
 from fastapi.responses import JSONResponse
 from fastapi.routing import APIRoute
 from pydantic import BaseModel, Field, RootModel
@@ -263,6 +263,24 @@ class TestRequestMigrations:
             "query_params": {"request2": "request2"},
         }
 
+    def test__non_ascii_header_set_by_migration__should_reach_endpoint_unchanged(
+        self,
+        create_versioned_clients: CreateVersionedClients,
+        test_path: Literal["/test"],
+        router: VersionedAPIRouter,
+    ):
+        @router.get(test_path)
+        async def get(my_header: str = Header()):
+            return my_header
+
+        @convert_request_to_next_version_for(test_path, ["GET"])
+        def migrator(request: RequestInfo):
+            request.headers["my-header"] = "café"
+
+        clients = create_versioned_clients(version_change(migrator=migrator))
+
+        assert clients[date(2000, 1, 1)].get(test_path, headers={"my-header": "cafe"}).json() == "café"
+
     def test__depends_gets_broken_after_migration__should_raise_500(
         self,
         create_versioned_clients: CreateVersionedClients,
@@ -892,6 +910,35 @@ def test__uploadfile_can_work(
     }
 
 
+@pytest.mark.parametrize(
+    ("content_type", "expected_body"),
+    [
+        ("application/json", "Hewwo"),
+        ("Application/JSON; charset=utf-8", "Hewwo"),
+        ("application/vnd.api+json", "Hewwo"),
+        ("text/plain", '"Hewwo"'),
+        ("application", '"Hewwo"'),
+    ],
+)
+def test__body_in_dependency__is_only_parsed_as_json_for_json_content_types(
+    create_versioned_clients: CreateVersionedClients,
+    test_path: Literal["/test"],
+    router: VersionedAPIRouter,
+    content_type: str,
+    expected_body: str,
+):
+    async def dependency(body: bytes = Body()):
+        return body
+
+    @router.post(test_path)
+    async def endpoint(payload: bytes = Depends(dependency)):
+        return payload.decode()
+
+    clients = create_versioned_clients(version_change())
+    resp = clients[date(2000, 1, 1)].post(test_path, content=b'"Hewwo"', headers={"content-type": content_type})
+    assert resp.json() == expected_body
+
+
 def test__request_and_response_migrations__for_paths_with_variables__can_match(
     create_versioned_clients: CreateVersionedClients,
     router: VersionedAPIRouter,
@@ -982,6 +1029,182 @@ def test__request_and_response_migrations__for_endpoint_with_http_exception__can
     assert resp_2001.json() == {"detail": "Not Found"}
 
 
+def test__request_and_response_migrations__for_endpoint_with_http_exception__can_migrate_error_detail(
+    create_versioned_clients: CreateVersionedClients,
+    router: VersionedAPIRouter,
+):
+    @router.post("/test")
+    async def endpoint():
+        raise HTTPException(status_code=404)
+
+    @convert_response_to_previous_version_for("/test", ["POST"], migrate_http_errors=True)
+    def error_converter(response: ResponseInfo):
+        response.body["detail"] = "Hewwo"
+
+    @convert_response_to_previous_version_for("/test", ["POST"])
+    def response_converter(response: ResponseInfo):
+        raise NotImplementedError("This should not be called")
+
+    clients = create_versioned_clients(version_change(err=error_converter, resp=response_converter))
+    resp_2000 = clients[date(2000, 1, 1)].post("/test")
+    assert resp_2000.status_code == 404
+    assert resp_2000.json() == {"detail": "Hewwo"}
+
+    resp_2001 = clients[date(2001, 1, 1)].post("/test")
+    assert resp_2001.status_code == 404
+    assert resp_2001.json() == {"detail": "Not Found"}
+
+
+def test__request_and_response_migrations__for_endpoint_with_http_exception_and_no_version__error_is_kept(
+    create_versioned_clients: CreateVersionedClients,
+    router: VersionedAPIRouter,
+    api_version_var: ContextVar[date | None],
+):
+    @router.post("/test")
+    async def endpoint():
+        raise HTTPException(status_code=404, detail="Hewwo", headers={"hewwo": "dawkness"})
+
+    clients = create_versioned_clients(version_change())
+    app = clients[date(2000, 1, 1)].app
+    none_client = client(
+        APIRouter(routes=app.router.versioned_routers[date(2000, 1, 1)].routes),
+        api_version=None,
+        api_version_var=api_version_var,
+    )
+    resp = none_client.post("/test")
+    assert resp.status_code == 404
+    assert resp.json() == {"detail": "Hewwo"}
+    assert resp.headers["hewwo"] == "dawkness"
+
+
+def test__response_migrations__for_endpoint_with_json_response__integers_over_64_bits_are_serialized(
+    create_versioned_clients: CreateVersionedClients,
+    router: VersionedAPIRouter,
+):
+    @router.post("/test")
+    async def endpoint():
+        return JSONResponse({"hello": "darkness"})
+
+    @convert_response_to_previous_version_for("/test", ["POST"])
+    def response_converter(response: ResponseInfo):
+        response.body["big"] = 2**70
+
+    clients = create_versioned_clients(version_change(resp=response_converter))
+    assert clients[date(2000, 1, 1)].post("/test").json() == {"hello": "darkness", "big": 2**70}
+    assert clients[date(2001, 1, 1)].post("/test").json() == {"hello": "darkness"}
+
+
+@pytest.mark.parametrize(
+    ("value", "error_type", "error_message"),
+    [
+        (float("nan"), ValueError, "Out of range float values are not JSON compliant"),
+        ([1.5, float("inf")], ValueError, "Out of range float values are not JSON compliant"),
+        (date(2000, 1, 1), TypeError, "Object of type date is not JSON serializable"),
+    ],
+)
+def test__response_migrations__migration_sets_value_that_is_not_valid_json__error(
+    create_versioned_clients: CreateVersionedClients,
+    router: VersionedAPIRouter,
+    value: Any,
+    error_type: type[Exception],
+    error_message: str,
+):
+    @router.post("/test")
+    async def endpoint():
+        return JSONResponse({"hello": "darkness"})
+
+    @convert_response_to_previous_version_for("/test", ["POST"])
+    def response_converter(response: ResponseInfo):
+        response.body["value"] = value
+
+    clients = create_versioned_clients(version_change(resp=response_converter))
+    with pytest.raises(error_type, match=error_message):
+        clients[date(2000, 1, 1)].post("/test")
+
+
+def test__response_migrations__migration_sets_non_string_keys__keys_are_serialized_as_strings(
+    create_versioned_clients: CreateVersionedClients,
+    router: VersionedAPIRouter,
+):
+    @router.post("/test")
+    async def endpoint():
+        return JSONResponse({"hello": "darkness"})
+
+    @convert_response_to_previous_version_for("/test", ["POST"])
+    def response_converter(response: ResponseInfo):
+        response.body = {1: "one", None: "none"}
+
+    clients = create_versioned_clients(version_change(resp=response_converter))
+    assert clients[date(2000, 1, 1)].post("/test").json() == {"1": "one", "null": "none"}
+
+
+def test__response_migrations__migration_sets_bytes_body__body_is_sent_as_is(
+    create_versioned_clients: CreateVersionedClients,
+    router: VersionedAPIRouter,
+):
+    @router.post("/test")
+    async def endpoint():
+        return Response(content="Hewwo", media_type="text/plain")
+
+    @convert_response_to_previous_version_for("/test", ["POST"])
+    def response_converter(response: ResponseInfo):
+        response.body = bytearray(b"Darkness")
+
+    clients = create_versioned_clients(version_change(resp=response_converter))
+    resp_2000 = clients[date(2000, 1, 1)].post("/test")
+    assert resp_2000.content == b"Darkness"
+    assert resp_2000.headers["content-length"] == "8"
+    assert clients[date(2001, 1, 1)].post("/test").content == b"Hewwo"
+
+
+def test__endpoint_without_response_migrations__returns_http_exception__error_is_kept(
+    create_versioned_clients: CreateVersionedClients,
+    router: VersionedAPIRouter,
+):
+    @router.post("/test")
+    async def endpoint():
+        raise HTTPException(status_code=404, detail="Hewwo", headers={"hewwo": "dawkness"})
+
+    clients = create_versioned_clients(version_change())
+    resp = clients[date(2000, 1, 1)].post("/test")
+    assert resp.status_code == 404
+    assert resp.json() == {"detail": "Hewwo"}
+    assert resp.headers["hewwo"] == "dawkness"
+
+
+def test__endpoint_without_response_migrations__returns_plain_response_with_json__body_is_kept(
+    create_versioned_clients: CreateVersionedClients,
+    router: VersionedAPIRouter,
+):
+    @router.post("/test")
+    async def endpoint():
+        return Response(content='{"hello": "darkness"}', media_type="application/json")
+
+    clients = create_versioned_clients(version_change())
+    resp = clients[date(2000, 1, 1)].post("/test")
+    assert resp.content == b'{"hello": "darkness"}'
+    assert resp.json() == {"hello": "darkness"}
+
+
+def test__endpoint_without_response_migrations__returns_head_model__model_is_dumped_before_versioned_validation(
+    create_versioned_clients: CreateVersionedClients,
+    router: VersionedAPIRouter,
+):
+    class ModelWithAlias(BaseModel):
+        foo: int = Field(alias="Foo")
+        bar: int = 1
+
+    @router.post("/test", response_model=ModelWithAlias, response_model_exclude_unset=True, status_code=201)
+    async def endpoint():
+        return ModelWithAlias(Foo=83)
+
+    clients = create_versioned_clients(version_change(schema(ModelWithAlias).field("bar").had(default=2)))
+    for versioned_client in clients.values():
+        resp = versioned_client.post("/test")
+        assert resp.status_code == 201
+        assert resp.json() == {"Foo": 83}
+
+
 def test__request_and_response_migrations__for_endpoint_with_no_default_status_code__response_should_contain_default(
     create_versioned_clients: CreateVersionedClients,
     router: VersionedAPIRouter,
@@ -1179,6 +1402,21 @@ def test__manual_response_migrations():
         )
 
 
+def test__manual_response_migrations__schema_without_migrations__body_is_only_validated():
+    version_bundle = VersionBundle(
+        Version(
+            date(2001, 1, 1),
+            version_change(schema(EmptySchema).field("name").existed_as(type=str, info=Field(default="Apples"))),
+        ),
+        Version(date(2000, 1, 1)),
+    )
+
+    new_response = migrate_response_body(
+        version_bundle, EmptySchema, latest_body={"name": "Bananas"}, version=date(2000, 1, 1)
+    )
+    assert new_response.model_dump() == {"name": "Bananas"}
+
+
 def test__request_and_response_migrations__with_multiple_schemas_in_converters(
     create_versioned_clients: CreateVersionedClients,
     router: VersionedAPIRouter,
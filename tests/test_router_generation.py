@@ -1,3 +1,4 @@
+import copy
 import importlib
 import re
 from collections.abc import Awaitable, Callable
@@ -139,6 +140,29 @@ def test__endpoint_existed(
     assert endpoints_equal(routes_2001[1].endpoint, test_endpoint_post)
 
 
+def test__endpoint_existed__restoring_routes_with_same_path_and_func_name_at_once(
+    router: VersionedAPIRouter,
+    create_versioned_api_routes: CreateVersionedAPIRoutes,
+):
+    def create_endpoint():
+        async def test_endpoint():
+            raise NotImplementedError
+
+        return test_endpoint
+
+    get_endpoint = router.only_exists_in_older_versions(router.get("/test")(create_endpoint()))
+    post_endpoint = router.only_exists_in_older_versions(router.post("/test")(create_endpoint()))
+
+    routes_2000, routes_2001 = create_versioned_api_routes(
+        version_change(endpoint("/test", ["GET", "POST"]).existed),
+    )
+
+    assert len(routes_2000) == 3
+    assert endpoints_equal(routes_2000[1].endpoint, get_endpoint)
+    assert endpoints_equal(routes_2000[2].endpoint, post_endpoint)
+    assert len(routes_2001) == 1
+
+
 def test__endpoint_existed__endpoint_removed_in_latest_but_never_restored__should_raise_error(
     router: VersionedAPIRouter,
     create_versioned_api_routes: CreateVersionedAPIRoutes,
@@ -250,6 +274,24 @@ def test__endpoint_had_another_path_variable(
         )
 
 
+def test__endpoint_had_path__later_instruction_in_same_version_uses_new_path(
+    test_endpoint: Endpoint,
+    test_path: str,
+    create_versioned_api_routes: CreateVersionedAPIRoutes,
+):
+    routes_2000, routes_2001 = create_versioned_api_routes(
+        version_change(
+            endpoint(test_path, ["GET"]).had(path="/older_test/{hewwo}"),
+            endpoint("/older_test/{hewwo}", ["GET"]).had(description="Older description"),
+        ),
+    )
+
+    assert len(routes_2000) == len(routes_2001) == 2
+    assert routes_2000[1].path == "/older_test/{hewwo}"
+    assert routes_2000[1].description == "Older description"
+    assert routes_2001[1].path == test_path
+
+
 def test__endpoint_had_dependencies(
     test_endpoint: Endpoint,
     test_path: str,
@@ -696,6 +738,30 @@ def test__router_generation__updating_response_model(
     assert get_nested_field_type(routes_2001[1].response_model) == int  # noqa: E721
 
 
+def test__router_generation__versioned_dependency_can_be_deepcopied(
+    router: VersionedAPIRouter,
+    create_versioned_api_routes: CreateVersionedAPIRoutes,
+):
+    async def dependency(body: SchemaWithOneIntField):
+        raise NotImplementedError
+
+    @router.post("/test", dependencies=[Depends(dependency)])
+    async def test():
+        raise NotImplementedError
+
+    routes_2000, _ = create_versioned_api_routes(
+        version_change(schema(SchemaWithOneIntField).field("foo").had(type=list[str]))
+    )
+    versioned_dependency = routes_2000[1].dependencies[-1].dependency
+    assert versioned_dependency is not None
+    dependency_copy = copy.deepcopy(versioned_dependency)
+
+    assert dependency_copy is not versioned_dependency
+    assert dependency_copy == dependency
+    assert dependency_copy.__annotations__ == versioned_dependency.__annotations__
+    assert dependency_copy.__globals__ is dependency.__globals__
+
+
 def test__router_generation__using_unversioned_schema_from_versioned_base_dir__should_not_raise_error(
     router: VersionedAPIRouter,
     create_versioned_app: CreateVersionedApp,
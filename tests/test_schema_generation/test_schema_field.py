@@ -600,6 +600,43 @@ def test__schema_field_had__with_weird_data_types__with_all_fields_modified(
     assert_models_are_equal(schemas["2000-01-01"][ModelWithWeirdFields], ExpectedSchema)
 
 
+def test__schema_field_had__with_unhashable_and_equal_but_distinct_defaults(
+    create_runtime_schemas: CreateRuntimeSchemas,
+):
+    class SchemaWithTrickyDefaults(BaseModel):
+        foo: set[int] = Field(default={1})
+        bar: int = Field(default=1)
+        baz: bool = Field(default=True)
+
+    schemas = create_runtime_schemas(
+        version_change(schema(SchemaWithTrickyDefaults).field("foo").had(description="...")),
+    )
+
+    class ExpectedSchema(BaseModel):
+        foo: set[int] = Field(default={1}, description="...")
+        bar: int = Field(default=1)
+        baz: bool = Field(default=True)
+
+    assert_models_are_equal(schemas["2000-01-01"][SchemaWithTrickyDefaults], ExpectedSchema)
+    assert schemas["2000-01-01"][SchemaWithTrickyDefaults].model_fields["baz"].default is True
+
+
+def test__schema_field_had__with_list_subclass_default(create_runtime_schemas: CreateRuntimeSchemas):
+    class MyList(list):
+        pass
+
+    class SchemaWithListSubclassDefault(BaseModel):
+        foo: list[int] = Field(default=MyList([1, 2]))
+
+    schemas = create_runtime_schemas(
+        version_change(schema(SchemaWithListSubclassDefault).field("foo").had(description="...")),
+    )
+
+    default = schemas["2000-01-01"][SchemaWithListSubclassDefault].model_fields["foo"].default
+    assert type(default) is MyList
+    assert default == [1, 2]
+
+
 def test__union_fields(create_runtime_schemas: CreateRuntimeSchemas):
     class SchemaWithUnionFields(BaseModel):
         foo: int | str